@@ -1,10 +1,12 @@
 import pytest
+from unittest import mock
 
 from yosai.core import (
     DefaultPermission,
     IndexedPermissionVerifier,
     SimpleRoleVerifier,
     WildcardPermission,
+    realm_abcs,
 )
 
 
@@ -30,3 +32,10 @@ def indexed_permission_verifier():
 @pytest.fixture(scope='function')
 def simple_role_verifier():
     return SimpleRoleVerifier()
+
+
+@pytest.fixture(scope='function')
+def mock_authz_realm():
+    # a non-callable spec skips autospec's signature walk yet still passes
+    # the AuthorizingRealm isinstance check:
+    return mock.NonCallableMagicMock(spec_set=realm_abcs.AuthorizingRealm)
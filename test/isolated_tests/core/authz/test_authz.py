@@ -1,6 +1,5 @@
 import pytest
 import collections
-import itertools
 from unittest import mock
 
 from yosai.core import (
@@ -8,23 +7,89 @@ from yosai.core import (
     IndexedAuthorizationInfo,
     ModularRealmAuthorizer,
     UnauthorizedException,
-    event_bus,
-    realm_abcs,
 )
 
+# only the event_bus attributes that ModularRealmAuthorizer uses:
+FAKE_EVENT_BUS_SPEC = ['subscribe', 'isSubscribed', 'sendMessage']
+
+
+# realm has_role / is_permitted stand-ins:
+def _yields_true(identifiers, items):
+    for x in items:
+        yield (x, True)
+
+
+def _yields_false(identifiers, items):
+    for x in items:
+        yield (x, False)
+
+
+def _stub_arc(mra):
+    """
+    replaces assert_realms_configured with a no-op mock on the test's
+    authorizer, returning the mock
+    """
+    mra.assert_realms_configured = mock.MagicMock(return_value=None)
+    return mra.assert_realms_configured
+
+
+# request inputs shared across tests; none of the code under test mutates them:
+_ROLEIDS = frozenset(('roleid1', 'roleid2'))
+_PERMS = frozenset(('permission1', 'permission2'))
+_PERM_LIST = ('perm1', 'perm2')
+
+# DefaultPermission parses its wildcard string / parts on construction, so the
+# permissions used by the IndexedPermissionVerifier tests are built once.
+_DP_D4A4 = DefaultPermission(wildcard_string='domain4:action4')
+_DP_D4_A12 = DefaultPermission(parts=dict(parts=dict(domain={'domain4'},
+                                                     action={'action1', 'action2'})))
+_DP_D4_A3_T1 = DefaultPermission(parts=dict(parts=dict(domain={'domain4'},
+                                                       action={'action3'},
+                                                       target={'target1'})))
+_DP_D6A1 = DefaultPermission(wildcard_string='domain6:action1')
+_DP_D7A1 = DefaultPermission(wildcard_string='domain7:action1')
+
+# DefaultPermission defines __eq__ but not __hash__, hence tuples:
+_DOMAINPERMS = (_DP_D4_A12, _DP_D4_A3_T1)
+_AUTHZ_PERMS = (_DP_D6A1, _DP_D7A1)
+
+# stand-ins for the three realms of modular_realm_authorizer_patched:
+ONE_REALM_GRANTS = (_yields_false, _yields_false, _yields_true)
+NO_REALM_GRANTS = (_yields_false, _yields_false, _yields_false)
+
+# (mock_results, logical_operator, expected):
+IS_PERMITTED_COLLECTIVE_CASES = (
+    ({('permission1', True), ('permission2', True)}, all, True),
+    ({('permission1', True), ('permission2', False)}, all, False),
+    ({('permission1', False), ('permission2', False)}, all, False),
+    ({('permission1', True), ('permission2', True)}, any, True),
+    ({('permission1', True), ('permission2', False)}, any, True),
+    ({('permission1', False), ('permission2', False)}, any, False))
+
+# (realms[0:2] results, realms[2] results, logical_operator, expected):
+HAS_ROLE_COLLECTIVE_CASES = (
+    ({('roleid1', False)}, {('roleid2', True)}, all, False),
+    ({('roleid1', True)}, {('roleid2', True)}, all, True),
+    ({('roleid1', True)}, {('roleid2', False)}, all, False),
+    ({('roleid1', False)}, {('roleid2', True)}, any, True),
+    ({('roleid1', True)}, {('roleid2', True)}, any, True),
+    ({('roleid1', True)}, {('roleid2', False)}, any, True))
+
+
 # -----------------------------------------------------------------------------
 # ModularRealmAuthorizer Tests
 # -----------------------------------------------------------------------------
 
 @mock.patch.object(ModularRealmAuthorizer, 'register_cache_clear_listener')
-def test_mra_init_realms(mock_rccl, modular_realm_authorizer_patched):
+def test_mra_init_realms(
+        mock_rccl, modular_realm_authorizer_patched, mock_authz_realm):
     mra = modular_realm_authorizer_patched
 
-    mock_authz_realm = mock.create_autospec(realm_abcs.AuthorizingRealm)
     faux_realm = type('FauxRealm', (object,), {})()
     realms = (mock_authz_realm, faux_realm,)
     mra.init_realms(realms)
     mock_rccl.assert_called_once_with()
+    assert mra.realms == (mock_authz_realm,)
 
 
 def test_mra_assert_realms_configured_success(modular_realm_authorizer_patched):
@@ -50,8 +115,7 @@ def test_mra_assert_realms_configured_fail(
         mra.assert_realms_configured()
 
 
-def test_mra_private_has_role_true_and_false(
-        modular_realm_authorizer_patched, monkeypatch):
+def test_mra_private_has_role_true_and_false(modular_realm_authorizer_patched):
     """
     unit tested:  _has_role
 
@@ -61,26 +125,16 @@ def test_mra_private_has_role_true_and_false(
     """
     mra = modular_realm_authorizer_patched
 
-    def has_role_yields_true(identifiers, roleid_s):
-        for x in roleid_s:
-            yield (x, True)
-
-    def has_role_yields_false(identifiers, roleid_s):
-        for x in roleid_s:
-            yield (x, False)
-
     # there are three realms set for this fixture:
-    monkeypatch.setattr(mra.realms[0], 'has_role', has_role_yields_false)
-    monkeypatch.setattr(mra.realms[1], 'has_role', has_role_yields_false)
-    monkeypatch.setattr(mra.realms[2], 'has_role', has_role_yields_true)
+    for realm, fn in zip(mra.realms, ONE_REALM_GRANTS):
+        realm.has_role = fn
 
     result = {(roleid, hasrole) for roleid, hasrole in
               mra._has_role('identifiers', {'roleid123'})}
     assert result == {('roleid123', False), ('roleid123', True)}
 
 
-def test_mra_private_is_permitted_true_and_false(
-        modular_realm_authorizer_patched, monkeypatch):
+def test_mra_private_is_permitted_true_and_false(modular_realm_authorizer_patched):
     """
     unit tested:  _is_permitted
 
@@ -90,25 +144,19 @@ def test_mra_private_is_permitted_true_and_false(
     """
     mra = modular_realm_authorizer_patched
 
-    def is_permitted_yields_true(identifiers, permission_s):
-        for x in permission_s:
-            yield (x, True)
-
-    def is_permitted_yields_false(identifiers, permission_s):
-        for x in permission_s:
-            yield (x, False)
-
     # there are three realms set for this fixture:
-    monkeypatch.setattr(mra.realms[0], 'is_permitted', is_permitted_yields_false)
-    monkeypatch.setattr(mra.realms[1], 'is_permitted', is_permitted_yields_false)
-    monkeypatch.setattr(mra.realms[2], 'is_permitted', is_permitted_yields_true)
+    for realm, fn in zip(mra.realms, ONE_REALM_GRANTS):
+        realm.is_permitted = fn
 
     result = {(permission, ispermitted) for permission, ispermitted in
               mra._is_permitted('identifiers', {'permission1'})}
     assert result == {('permission1', False), ('permission1', True)}
 
 
-def test_mra_is_permitted_succeeds(modular_realm_authorizer_patched, monkeypatch):
+@pytest.mark.parametrize('realm_fns, expected',
+                         [(ONE_REALM_GRANTS, True),
+                          (NO_REALM_GRANTS, False)])
+def test_mra_is_permitted(modular_realm_authorizer_patched, realm_fns, expected):
     """
     unit tested:  is_permitted
 
@@ -120,72 +168,25 @@ def test_mra_is_permitted_succeeds(modular_realm_authorizer_patched, monkeypatch
     """
     mra = modular_realm_authorizer_patched
 
-    def is_permitted_yields_true(identifiers, permission_s):
-        for x in permission_s:
-            yield (x, True)
-
-    def is_permitted_yields_false(identifiers, permission_s):
-        for x in permission_s:
-            yield (x, False)
-
     # there are three realms set for this fixture:
-    monkeypatch.setattr(mra.realms[0], 'is_permitted', is_permitted_yields_false)
-    monkeypatch.setattr(mra.realms[1], 'is_permitted', is_permitted_yields_false)
-    monkeypatch.setattr(mra.realms[2], 'is_permitted', is_permitted_yields_true)
-
-    with mock.patch.object(mra, 'assert_realms_configured') as mra_arc:
-        mra_arc.return_value = None
-
-        with mock.patch.object(mra, 'notify_event') as mra_nr:
-            mra_nr.return_value = None
-
-            results = mra.is_permitted('identifiers', ['permission1', 'permission2'], False)
-
-            mra_arc.assert_called_once_with()
-
-            assert set(results) == set([('permission1', True), ('permission2', True)])
-
-
-def test_mra_is_permitted_fails(modular_realm_authorizer_patched, monkeypatch):
-    """
-    unit tested:  is_permitted
-
-    test case:
-    - for each permission passed, passes the permission to the private _is_permitted
-      method
-    - every authorizing realms is consulted for each permission and only one realm needs
-      to return true in order for the permission to be granted
-    """
-    mra = modular_realm_authorizer_patched
-
-    def is_permitted_yields_false(identifiers, permission_s):
-        for x in permission_s:
-            yield (x, False)
+    for realm, fn in zip(mra.realms, realm_fns):
+        realm.is_permitted = fn
 
-    # there are three realms set for this fixture:
-    monkeypatch.setattr(mra.realms[0], 'is_permitted', is_permitted_yields_false)
-    monkeypatch.setattr(mra.realms[1], 'is_permitted', is_permitted_yields_false)
-    monkeypatch.setattr(mra.realms[2], 'is_permitted', is_permitted_yields_false)
+    mra_arc = _stub_arc(mra)
 
-    with mock.patch.object(mra, 'assert_realms_configured') as mra_arc:
-        mra_arc.return_value = None
+    with mock.patch.object(mra, 'notify_event') as mra_nr:
+        mra_nr.return_value = None
 
-        results = mra.is_permitted('identifiers', {'permission1', 'permission2'}, False)
+        results = mra.is_permitted('identifiers', _PERMS, False)
 
         mra_arc.assert_called_once_with()
-        assert set(results) == set([('permission1', False), ('permission2', False)])
+
+        assert set(results) == set([('permission1', expected),
+                                    ('permission2', expected)])
 
 
-@pytest.mark.parametrize('mock_results, logical_operator, expected',
-                         [({('permission1', True), ('permission2', True)}, all, True),
-                          ({('permission1', True), ('permission2', False)}, all, False),
-                          ({('permission1', False), ('permission2', False)}, all, False),
-                          ({('permission1', True), ('permission2', True)}, any, True),
-                          ({('permission1', True), ('permission2', False)}, any, True),
-                          ({('permission1', False), ('permission2', False)}, any, False)])
 def test_mra_is_permitted_collective(
-        modular_realm_authorizer_patched, monkeypatch, mock_results,
-        logical_operator, expected):
+        modular_realm_authorizer_patched, monkeypatch):
     """
     unit tested:  is_permitted_collective
 
@@ -193,31 +194,35 @@ def test_mra_is_permitted_collective(
     a collection of permissions receives a single Boolean
     """
     mra = modular_realm_authorizer_patched
-    monkeypatch.setattr(mra, 'is_permitted', lambda x,y,log_results: mock_results)
-    with mock.patch.object(mra, 'assert_realms_configured') as mra_arc:
-        mra_arc.return_value = None
-        with mock.patch.object(mra, 'notify_event') as mra_ne:
-            mra_ne.return_value = None
+    mra_arc = _stub_arc(mra)
+
+    with mock.patch.object(mra, 'notify_event') as mra_ne:
+        mra_ne.return_value = None
+
+        for mock_results, logical_operator, expected in IS_PERMITTED_COLLECTIVE_CASES:
+            mra_arc.reset_mock()
+            mra_ne.reset_mock()
+            monkeypatch.setattr(mra, 'is_permitted',
+                                lambda x, y, log_results, r=mock_results: r)
 
             results = mra.is_permitted_collective({'identifiers'},
-                                                  ['perm1', 'perm2'],
+                                                  _PERM_LIST,
                                                   logical_operator)
             mra_arc.assert_called_once_with()
             assert results == expected
             if expected is True:
                 mra_ne.assert_called_once_with({'identifiers'},
-                                               ['perm1', 'perm2'],
+                                               _PERM_LIST,
                                                'AUTHORIZATION.GRANTED',
                                                logical_operator)
 
             else:
                 mra_ne.assert_called_once_with({'identifiers'},
-                                               ['perm1', 'perm2'],
+                                               _PERM_LIST,
                                                'AUTHORIZATION.DENIED',
                                                logical_operator)
 
 
-
 def test_mra_check_permission_collection_raises(
         modular_realm_authorizer_patched, monkeypatch):
     """
@@ -228,12 +233,11 @@ def test_mra_check_permission_collection_raises(
     """
     mra = modular_realm_authorizer_patched
     monkeypatch.setattr(mra, 'is_permitted_collective', lambda x,y,z: False)
-    with mock.patch.object(mra, 'assert_realms_configured') as mra_arc:
-        mra_arc.return_value = None
+    mra_arc = _stub_arc(mra)
 
-        with pytest.raises(UnauthorizedException):
-            mra.check_permission('arbitrary_identifiers', ['perm1', 'perm2'], all)
-            mra_arc.assert_called_once_with()
+    with pytest.raises(UnauthorizedException):
+        mra.check_permission('arbitrary_identifiers', _PERM_LIST, all)
+    mra_arc.assert_called_once_with()
 
 
 def test_mra_check_permission_collection_succeeds(
@@ -248,14 +252,16 @@ def test_mra_check_permission_collection_succeeds(
     mra = modular_realm_authorizer_patched
     monkeypatch.setattr(mra, 'is_permitted_collective', lambda x,y,z: True)
 
-    with mock.patch.object(mra, 'assert_realms_configured') as mra_arc:
-        mra_arc.return_value = None
+    mra_arc = _stub_arc(mra)
 
-        mra.check_permission('arbitrary_identifiers', ['perm1', 'perm2'], all)
-        mra_arc.assert_called_once_with()
+    mra.check_permission('arbitrary_identifiers', _PERM_LIST, all)
+    mra_arc.assert_called_once_with()
 
 
-def test_mra_has_role_succeeds(modular_realm_authorizer_patched, monkeypatch):
+@pytest.mark.parametrize('realm_fns, expected',
+                         [(ONE_REALM_GRANTS, True),
+                          (NO_REALM_GRANTS, False)])
+def test_mra_has_role(modular_realm_authorizer_patched, realm_fns, expected):
     """
     unit tested:  has_role
 
@@ -267,75 +273,23 @@ def test_mra_has_role_succeeds(modular_realm_authorizer_patched, monkeypatch):
     """
     mra = modular_realm_authorizer_patched
 
-    def has_role_yields_true(identifiers, roleid_s):
-        for x in roleid_s:
-            yield (x, True)
-
-    def has_role_yields_false(identifiers, roleid_s):
-        for x in roleid_s:
-            yield (x, False)
-
     # there are three realms set for this fixture:
-    monkeypatch.setattr(mra.realms[0], 'has_role', has_role_yields_false)
-    monkeypatch.setattr(mra.realms[1], 'has_role', has_role_yields_false)
-    monkeypatch.setattr(mra.realms[2], 'has_role', has_role_yields_true)
-
-    with mock.patch.object(mra, 'assert_realms_configured') as mra_arc:
-        mra_arc.return_value = None
-
-        with mock.patch.object(mra, 'notify_event') as mra_nr:
-            mra_nr.return_value = None
-
-            results = mra.has_role('identifiers', {'roleid1', 'roleid2'})
-
-            mra_arc.assert_called_once_with()
-
-            assert set(results) == set([('roleid1', True), ('roleid2', True)])
-
-
-def test_mra_has_role_fails(modular_realm_authorizer_patched, monkeypatch):
-    """
-    unit tested:  has_role
-
-    test case:
-    - for each roleid passed, passes the roleid to the private _has_role
-      method
-    - every authorizing realm is consulted for each roleid and only one realm needs
-      to return true in order for the has_role request to be granted
-    """
-    mra = modular_realm_authorizer_patched
+    for realm, fn in zip(mra.realms, realm_fns):
+        realm.has_role = fn
 
-    def has_role_yields_false(identifiers, roleid_s):
-        for x in roleid_s:
-            yield (x, False)
+    mra_arc = _stub_arc(mra)
 
-    # there are three realms set for this fixture:
-    monkeypatch.setattr(mra.realms[0], 'has_role', has_role_yields_false)
-    monkeypatch.setattr(mra.realms[1], 'has_role', has_role_yields_false)
-    monkeypatch.setattr(mra.realms[2], 'has_role', has_role_yields_false)
+    with mock.patch.object(mra, 'notify_event') as mra_nr:
+        mra_nr.return_value = None
 
-    with mock.patch.object(mra, 'assert_realms_configured') as mra_arc:
-        mra_arc.return_value = None
+        results = mra.has_role('identifiers', _ROLEIDS)
 
-        with mock.patch.object(mra, 'notify_event') as mock_nr:
-            mock_nr.return_value = None
+        mra_arc.assert_called_once_with()
 
-            results = mra.has_role('identifiers', {'roleid1', 'roleid2'})
+        assert set(results) == set([('roleid1', expected), ('roleid2', expected)])
 
-            mra_arc.assert_called_once_with()
-            assert set(results) == set([('roleid1', False), ('roleid2', False)])
 
-
-@pytest.mark.parametrize('param1, param2, logical_operator, expected',
-                         [({('roleid1', False)}, {('roleid2', True)}, all, False),
-                          ({('roleid1', True)}, {('roleid2', True)}, all, True),
-                          ({('roleid1', True)}, {('roleid2', False)}, all, False),
-                          ({('roleid1', False)}, {('roleid2', True)}, any, True),
-                          ({('roleid1', True)}, {('roleid2', True)}, any, True),
-                          ({('roleid1', True)}, {('roleid2', False)}, any, True)])
-def test_mra_has_role_collective(
-        modular_realm_authorizer_patched, monkeypatch, param1, param2,
-        logical_operator, expected):
+def test_mra_has_role_collective(modular_realm_authorizer_patched):
     """
     unit tested:  has_role_collective
 
@@ -344,28 +298,31 @@ def test_mra_has_role_collective(
     """
     mra = modular_realm_authorizer_patched
 
-    monkeypatch.setattr(mra.realms[0], 'has_role', lambda x, y: param1)
-    monkeypatch.setattr(mra.realms[1], 'has_role', lambda x, y: param1)
-    monkeypatch.setattr(mra.realms[2], 'has_role', lambda x, y: param2)
+    arc = _stub_arc(mra)
+
+    with mock.patch.object(mra, 'notify_event') as mra_ne:
+        mra_ne.return_value = None
 
-    with mock.patch.object(ModularRealmAuthorizer, 'assert_realms_configured') as arc:
-        arc.return_value = None
+        for param1, param2, logical_operator, expected in HAS_ROLE_COLLECTIVE_CASES:
+            arc.reset_mock()
+            mra_ne.reset_mock()
+            mra.realms[0].has_role = lambda x, y, r=param1: r
+            mra.realms[1].has_role = lambda x, y, r=param1: r
+            mra.realms[2].has_role = lambda x, y, r=param2: r
 
-        with mock.patch.object(mra, 'notify_event') as mra_ne:
-            mra_ne.return_value = None
             result = mra.has_role_collective('arbitrary_identifiers',
-                                             ['roleid1', 'roleid2'],
+                                             _ROLEIDS,
                                              logical_operator)
 
             if expected is True:
                 mra_ne.assert_called_once_with('arbitrary_identifiers',
-                                               ['roleid1', 'roleid2'],
+                                               list(_ROLEIDS),
                                                'AUTHORIZATION.GRANTED',
                                                logical_operator)
 
             else:
                 mra_ne.assert_called_once_with('arbitrary_identifiers',
-                                               ['roleid1', 'roleid2'],
+                                               list(_ROLEIDS),
                                                'AUTHORIZATION.DENIED',
                                                logical_operator)
 
@@ -383,12 +340,12 @@ def test_mra_check_role_raises(
     """
     mra = modular_realm_authorizer_patched
     monkeypatch.setattr(mra, 'has_role_collective', lambda x,y,z: False)
-    with mock.patch.object(ModularRealmAuthorizer, 'assert_realms_configured') as arc:
-        arc.return_value = None
-        with pytest.raises(UnauthorizedException):
-            mra.check_role('arbitrary_identifiers', ['roleid1', 'roleid2'], all)
+    arc = _stub_arc(mra)
 
-            arc.assert_called_once_with()
+    with pytest.raises(UnauthorizedException):
+        mra.check_role('arbitrary_identifiers', _ROLEIDS, all)
+
+    arc.assert_called_once_with()
 
 
 def test_mra_check_role_true(
@@ -403,18 +360,16 @@ def test_mra_check_role_true(
 
     mra = modular_realm_authorizer_patched
     monkeypatch.setattr(mra, 'has_role_collective', lambda x,y,z: True)
-    with mock.patch.object(ModularRealmAuthorizer, 'assert_realms_configured') as arc:
-        arc.return_value = None
+    arc = _stub_arc(mra)
 
-        mra.check_role('identifiers', 'roleid_s', all)
-        arc.assert_called_once_with()
+    mra.check_role('identifiers', 'roleid_s', all)
+    arc.assert_called_once_with()
 
 
 def test_mraa_session_clears_cache(
-        modular_realm_authorizer_patched, monkeypatch):
+        modular_realm_authorizer_patched, monkeypatch, mock_authz_realm):
 
     mra = modular_realm_authorizer_patched
-    mock_authz_realm = mock.create_autospec(realm_abcs.AuthorizingRealm)
     monkeypatch.setattr(mra, 'realms', (mock_authz_realm,))
     mock_items = mock.MagicMock(identifier='identifier')
     mra.session_clears_cache(items=mock_items)
@@ -423,9 +378,9 @@ def test_mraa_session_clears_cache(
         assert_called_once_with(mock_items.identifier)
 
 
-def test_mraa_authc_clears_cache(modular_realm_authorizer_patched, monkeypatch):
+def test_mraa_authc_clears_cache(
+        modular_realm_authorizer_patched, monkeypatch, mock_authz_realm):
     mra = modular_realm_authorizer_patched
-    mock_authz_realm = mock.create_autospec(realm_abcs.AuthorizingRealm)
     monkeypatch.setattr(mra, 'realms', (mock_authz_realm,))
 
     mra.authc_clears_cache('identifier')
@@ -434,10 +389,24 @@ def test_mraa_authc_clears_cache(modular_realm_authorizer_patched, monkeypatch):
         assert_called_once_with('identifier')
 
 
+def test_mraa_authc_clears_cache_fails(
+        modular_realm_authorizer_patched, monkeypatch):
+    """
+    test case:
+    a realm that cannot clear its cache is logged rather than raised
+    """
+    mra = modular_realm_authorizer_patched
+    monkeypatch.setattr(mra, 'realms', (object(),))
+
+    with mock.patch('yosai.core.authz.authz.logger') as mock_logger:
+        mra.authc_clears_cache('identifier')
+        assert 'identifier' in mock_logger.warn.call_args[0][0]
+
+
 def test_mra_register_cache_clear_listener(
         modular_realm_authorizer_patched, monkeypatch):
     mra = modular_realm_authorizer_patched
-    mock_bus = mock.create_autospec(event_bus)
+    mock_bus = mock.MagicMock(spec_set=FAKE_EVENT_BUS_SPEC)
     monkeypatch.setattr(mra, 'event_bus', mock_bus)
 
     mra.register_cache_clear_listener()
@@ -457,7 +426,7 @@ def test_mra_notify_event(modular_realm_authorizer_patched, monkeypatch):
     """
     mra = modular_realm_authorizer_patched
     items = [('permission1', True)]
-    mock_bus = mock.create_autospec(event_bus)
+    mock_bus = mock.MagicMock(spec_set=FAKE_EVENT_BUS_SPEC)
     monkeypatch.setattr(mra, 'event_bus', mock_bus)
 
     mra.notify_event('identifiers', items, topic='AUTHORIZATION.RESULTS')
@@ -503,7 +472,7 @@ def test_iai_permissions_isset(
                     {'parts': {'domain': '*', 'action': 'action3', 'target': ['target3', 'target4']}}]
 
     info.permissions = test_results
-    assert len(list(itertools.chain.from_iterable(info._permissions.values()))) == 3
+    assert sum(len(v) for v in info._permissions.values()) == 3
 
 
 def test_iai_permissions_setter(indexed_authz_info, monkeypatch):
@@ -573,7 +542,7 @@ def test_iai_index_permission(indexed_authz_info, monkeypatch):
                     {'parts': {'domain': '*', 'action': 'action3', 'target': ['target3', 'target4']}}]
 
     info.index_permission(test_results)
-    assert len(list(itertools.chain.from_iterable(info._permissions.values()))) == 3
+    assert sum(len(v) for v in info._permissions.values()) == 3
 
 
 @pytest.mark.parametrize('domain, expected',
@@ -603,16 +572,12 @@ def test_ipv_get_authzd_permissions(
     permission argument
     """
     ipv = indexed_permission_verifier
-    perm = DefaultPermission(wildcard_string='domain4:action4')
-
-    domainperms = [DefaultPermission(parts=dict(parts=dict(domain={'domain4'}, action={'action1', 'action2'}))),
-                   DefaultPermission(parts=dict(parts=dict(domain={'domain4'}, action={'action3'}, target={'target1'})))]
 
-    monkeypatch.setattr(indexed_authz_info, 'get_permissions', lambda x: domainperms)
+    monkeypatch.setattr(indexed_authz_info, 'get_permissions', lambda x: _DOMAINPERMS)
 
-    result = ipv.get_authzd_permissions(indexed_authz_info, perm)
+    result = ipv.get_authzd_permissions(indexed_authz_info, _DP_D4A4)
 
-    assert domainperms+domainperms == result
+    assert list(_DOMAINPERMS + _DOMAINPERMS) == result
 
 
 def test_ipv_is_permitted(
@@ -628,12 +593,10 @@ def test_ipv_is_permitted(
     """
     ipv = indexed_permission_verifier
 
-    dp1 = DefaultPermission(wildcard_string='domain6:action1')
-    monkeypatch.setattr(dp1, 'implies', lambda x: False)
-    dp2 = DefaultPermission(wildcard_string='domain7:action1')
-    monkeypatch.setattr(dp2, 'implies', lambda x: True)
-    authz_perms = [dp1, dp2]
-    monkeypatch.setattr(ipv, 'get_authzd_permissions', lambda x,y: authz_perms)
+    # monkeypatch restores the shared permissions' implies after the test:
+    monkeypatch.setattr(_DP_D6A1, 'implies', lambda x: False)
+    monkeypatch.setattr(_DP_D7A1, 'implies', lambda x: True)
+    monkeypatch.setattr(ipv, 'get_authzd_permissions', lambda x,y: _AUTHZ_PERMS)
 
     perm1 = 'domain1:action1'
     perm2 = 'domain2:action1'
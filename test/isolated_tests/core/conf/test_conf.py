@@ -1,4 +1,6 @@
 import pytest
+import threading
+import time
 from unittest import mock
 from yosai.core import (
     LazySettings,
@@ -13,6 +15,29 @@ def test_get_attr_from_empty_wrapped(lazy_settings, monkeypatch):
     assert isinstance(lazy_settings._wrapped, Settings)
 
 
+def test_get_attr_concurrent_setup_loads_once(lazy_settings):
+    """
+    test case:
+    threads racing on first access to empty settings load the settings once
+    """
+    def slow_settings(settings_file):
+        time.sleep(0.01)
+        return mock.sentinel.settings
+
+    with mock.patch('yosai.core.conf.yosaisettings.Settings',
+                    side_effect=slow_settings) as mock_settings:
+        threads = [threading.Thread(target=getattr,
+                                    args=(lazy_settings, 'blabla', None))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert mock_settings.call_count == 1
+    assert lazy_settings._wrapped is mock.sentinel.settings
+
+
 def test_set_attr_wrapped(lazy_settings, config):
     lazy_settings._wrapped = config
     assert lazy_settings._wrapped == config
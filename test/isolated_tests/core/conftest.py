@@ -74,7 +74,7 @@ def simple_identifier_collection():
     return SimpleIdentifierCollection(source_name='AccountStoreRealm',
                                       identifier='identifier')
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def authz_realms_collection():
     """
     three authorizing realms
@@ -84,15 +84,31 @@ def authz_realms_collection():
             MockAuthzAccountStoreRealm())
 
 
-@pytest.fixture(scope='function')
-def modular_realm_authorizer_patched(
-        monkeypatch, authz_realms_collection, event_bus):
+@pytest.fixture(scope='session')
+def _modular_realm_authorizer_base(authz_realms_collection, event_bus):
     a = ModularRealmAuthorizer()
-    monkeypatch.setattr(a, 'realms', authz_realms_collection)
-    monkeypatch.setattr(a, 'event_bus', event_bus)
+    a.realms = authz_realms_collection
+    a.event_bus = event_bus
     return a
 
 
+@pytest.fixture(scope='function')
+def modular_realm_authorizer_patched(_modular_realm_authorizer_base):
+    """
+    the session-wide authorizer, restored to its base state after each test
+    """
+    mra = _modular_realm_authorizer_base
+    base_state = dict(vars(mra))
+
+    yield mra
+
+    vars(mra).clear()
+    vars(mra).update(base_state)
+    # the realm doubles carry no instance state of their own:
+    for realm in mra.realms:
+        vars(realm).clear()
+
+
 @pytest.fixture(scope='function')
 def sample_authc_info():
     return {'password': {'credential': '$2a$12$Gf.YpcTN8r5vQydvLl9o1O8KoTbeFrYCkR22NaJawMFFfceiQ0XOi',
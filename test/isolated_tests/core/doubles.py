@@ -133,7 +133,7 @@ class MockSecurityManager(mgt_abcs.SecurityManager):
     def logout(self, subject):
         pass
 
-    def create_subject(self, subject_context):
+    def create_subject(self, subject_context, copy_context=True):
         pass
 
     def start(self, session_context):
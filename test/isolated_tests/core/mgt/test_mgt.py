@@ -73,82 +73,153 @@ def test_apply_realms(native_security_manager, monkeypatch):
     mock_authz.init_realms.assert_called_once_with('realms')
 
 
-def test_nsm_is_permitted(native_security_manager):
+@pytest.mark.parametrize('realms, expected',
+                         [(None, ()),
+                          (['realm1', 'realm2'], ('realm1', 'realm2'))])
+def test_nsm_init_realms_tuple(yosai, core_settings, realms, expected):
+    """
+    test case:
+    realms are held as a tuple, an empty one when none are given
+    """
+    with mock.patch.object(NativeSecurityManager, 'apply_cache_handler'):
+        with mock.patch.object(NativeSecurityManager, 'apply_realms'):
+            nsm = NativeSecurityManager(yosai, core_settings, realms=realms,
+                                        authorizer=ModularRealmAuthorizer())
+    assert nsm.realms == expected
+
+
+def test_nsm_is_permitted(native_security_manager, monkeypatch):
     """
     unit tested:  is_permitted
 
     test case:
-    passes request on to authorizer
+    the authorizer's own method serves the request
     """
     nsm = native_security_manager
-    with mock.patch.object(ModularRealmAuthorizer, 'is_permitted') as mra_ip:
+    mock_authz = mock.create_autospec(ModularRealmAuthorizer)
+    monkeypatch.setattr(nsm, 'authorizer', mock_authz)
+    nsm.is_permitted('identifiers', 'permission_s')
+    mock_authz.is_permitted.assert_called_once_with('identifiers', 'permission_s')
+
+
+def test_nsm_subclass_override_not_shadowed(yosai, core_settings):
+    """
+    unit tested:  bind_delegate_methods
+
+    test case:
+    a subclass's override is kept when the authorizer is set, while the
+    methods it does not override are bound from the authorizer
+    """
+    class OverridingSecurityManager(NativeSecurityManager):
+        def is_permitted(self, identifiers, permission_s):
+            return 'overridden'
+
+    mock_authz = mock.create_autospec(ModularRealmAuthorizer)
+    with mock.patch.object(NativeSecurityManager, 'apply_cache_handler'):
+        with mock.patch.object(NativeSecurityManager, 'apply_realms'):
+            nsm = OverridingSecurityManager(yosai, core_settings,
+                                            authorizer=mock_authz)
+
+    assert nsm.is_permitted('identifiers', 'permission_s') == 'overridden'
+    mock_authz.is_permitted.assert_not_called()
+    assert nsm.has_role is mock_authz.has_role
+
+
+def test_nsm_patch_delegates_round_trip(native_security_manager):
+    """
+    unit tested:  authorizer / session_manager deleters
+
+    test case:
+    patching the authorizer and session_manager binds the mocks' methods and,
+    on exit, restores the originals along with their bound methods
+    """
+    nsm = native_security_manager
+    authorizer = nsm.authorizer
+    session_manager = nsm.session_manager
+    mock_authz = mock.create_autospec(ModularRealmAuthorizer)
+    mock_sm = mock.create_autospec(NativeSessionManager)
+
+    with mock.patch.object(nsm, 'authorizer', mock_authz), \
+            mock.patch.object(nsm, 'session_manager', mock_sm):
         nsm.is_permitted('identifiers', 'permission_s')
-        mra_ip.assert_called_once_with('identifiers', 'permission_s')
+        nsm.get_session('sessionkey123')
+        mock_authz.is_permitted.assert_called_once_with('identifiers', 'permission_s')
+        mock_sm.get_session.assert_called_once_with('sessionkey123')
+
+    assert nsm.authorizer is authorizer
+    assert nsm.session_manager is session_manager
+    assert nsm.is_permitted == authorizer.is_permitted
+    assert nsm.get_session == session_manager.get_session
 
 
-def test_nsm_is_permitted_collective(native_security_manager):
+def test_nsm_is_permitted_collective(native_security_manager, monkeypatch):
     """
     unit tested: is_permitted_collective
 
     test case:
-    passes request on to authorizer
+    the authorizer's own method serves the request
     """
     nsm = native_security_manager
-    with mock.patch.object(ModularRealmAuthorizer, 'is_permitted_collective') as mra_ipa:
-        nsm.is_permitted_collective('identifiers', 'permission_s', all)
-        mra_ipa.assert_called_once_with('identifiers', 'permission_s', all)
+    mock_authz = mock.create_autospec(ModularRealmAuthorizer)
+    monkeypatch.setattr(nsm, 'authorizer', mock_authz)
+    nsm.is_permitted_collective('identifiers', 'permission_s', all)
+    mock_authz.is_permitted_collective.assert_called_once_with('identifiers', 'permission_s', all)
 
 
-def test_nsm_check_permission(native_security_manager):
+def test_nsm_check_permission(native_security_manager, monkeypatch):
     """
     unit tested:  check_permission
 
     test case:
-    passes request on to authorizer
+    the authorizer's own method serves the request
     """
     nsm = native_security_manager
-    with mock.patch.object(ModularRealmAuthorizer, 'check_permission') as mra_cp:
-        nsm.check_permission('identifiers', 'permission_s', all)
-        mra_cp.assert_called_once_with('identifiers', 'permission_s', all)
+    mock_authz = mock.create_autospec(ModularRealmAuthorizer)
+    monkeypatch.setattr(nsm, 'authorizer', mock_authz)
+    nsm.check_permission('identifiers', 'permission_s', all)
+    mock_authz.check_permission.assert_called_once_with('identifiers', 'permission_s', all)
 
 
-def test_nsm_has_role(native_security_manager):
+def test_nsm_has_role(native_security_manager, monkeypatch):
     """
     unit tested:  has_role
 
     test case:
-    passes request on to authorizer
+    the authorizer's own method serves the request
     """
     nsm = native_security_manager
-    with mock.patch.object(ModularRealmAuthorizer, 'has_role') as mra_hr:
-        nsm.has_role('identifiers', 'permission_s')
-        mra_hr.assert_called_once_with('identifiers', 'permission_s')
+    mock_authz = mock.create_autospec(ModularRealmAuthorizer)
+    monkeypatch.setattr(nsm, 'authorizer', mock_authz)
+    nsm.has_role('identifiers', 'permission_s')
+    mock_authz.has_role.assert_called_once_with('identifiers', 'permission_s')
 
 
-def test_nsm_has_role_collective(native_security_manager):
+def test_nsm_has_role_collective(native_security_manager, monkeypatch):
     """
     unit tested:  has_role_collective
 
     test case:
-    passes request on to authorizer
+    the authorizer's own method serves the request
     """
     nsm = native_security_manager
-    with mock.patch.object(ModularRealmAuthorizer, 'has_role_collective') as mra_har:
-        nsm.has_role_collective('identifiers', 'permission_s', all)
-        mra_har.assert_called_once_with('identifiers', 'permission_s', all)
+    mock_authz = mock.create_autospec(ModularRealmAuthorizer)
+    monkeypatch.setattr(nsm, 'authorizer', mock_authz)
+    nsm.has_role_collective('identifiers', 'permission_s', all)
+    mock_authz.has_role_collective.assert_called_once_with('identifiers', 'permission_s', all)
 
 
-def test_nsm_check_role(native_security_manager):
+def test_nsm_check_role(native_security_manager, monkeypatch):
     """
     unit tested:  check_role
 
     test case:
-    passes request on to authorizer
+    the authorizer's own method serves the request
     """
     nsm = native_security_manager
-    with mock.patch.object(ModularRealmAuthorizer, 'check_role') as mra_cr:
-        nsm.check_role('identifiers', 'permission_s', all)
-        mra_cr.assert_called_once_with('identifiers', 'permission_s', all)
+    mock_authz = mock.create_autospec(ModularRealmAuthorizer)
+    monkeypatch.setattr(nsm, 'authorizer', mock_authz)
+    nsm.check_role('identifiers', 'permission_s', all)
+    mock_authz.check_role.assert_called_once_with('identifiers', 'permission_s', all)
 
 def test_nsm_start(
         native_security_manager, mock_default_session_manager, monkeypatch):
@@ -156,12 +227,13 @@ def test_nsm_start(
     unit tested:  start
 
     test case:
-    passes request on to session manager
+    the session manager's own method serves the request
     """
     nsm = native_security_manager
     mnsm = mock_default_session_manager
-    monkeypatch.setattr(nsm, 'session_manager', mnsm)
     with mock.patch.object(MockNativeSessionManager, 'start') as mnsm_start:
+        # the session manager's methods are bound when it is set:
+        monkeypatch.setattr(nsm, 'session_manager', mnsm)
         mnsm_start.return_value = None
         nsm.start('session_context')
         mnsm_start.assert_called_once_with('session_context')
@@ -172,12 +244,13 @@ def test_nsm_get_session(
     unit tested:  get_session
 
     test case:
-    passes request on to session manager
+    the session manager's own method serves the request
     """
     nsm = native_security_manager
     mnsm = mock_default_session_manager
-    monkeypatch.setattr(nsm, 'session_manager', mnsm)
     with mock.patch.object(MockNativeSessionManager, 'get_session') as mnsm_gs:
+        # the session manager's methods are bound when it is set:
+        monkeypatch.setattr(nsm, 'session_manager', mnsm)
         mnsm_gs.return_value = None
         nsm.get_session('sessionkey123')
         mnsm_gs.assert_called_once_with('sessionkey123')
@@ -270,6 +343,55 @@ def test_nsm_create_subject_w_context(native_security_manager, yosai):
                         nsm_dcs.assert_called_once_with(testcontext)
 
 
+def test_nsm_create_subject_wo_context_login_attributes(native_security_manager):
+    """
+    unit tested:  create_subject
+
+    test case:
+    the new subject_context carries the login attributes
+    """
+    nsm = native_security_manager
+
+    with mock.patch.object(nsm, 'ensure_security_manager') as nsm_esm, \
+            mock.patch.object(nsm, 'resolve_session'), \
+            mock.patch.object(nsm, 'resolve_identifiers'), \
+            mock.patch.object(nsm, 'do_create_subject'), \
+            mock.patch.object(nsm, 'save'):
+
+        nsm.create_subject(authc_token='dumb_token',
+                           account_id='dumb_account',
+                           existing_subject='existing_subject')
+
+        context = nsm_esm.call_args[0][0]
+        assert context.authenticated is True
+        assert context.authentication_token == 'dumb_token'
+        assert context.account_id == 'dumb_account'
+        assert context.subject == 'existing_subject'
+
+
+@pytest.mark.parametrize('copy_context, is_same', [(True, False), (False, True)])
+def test_nsm_create_subject_copy_context(
+        native_security_manager, yosai, copy_context, is_same):
+    """
+    unit tested:  create_subject
+
+    test case:
+    the passed context is resolved as a copy unless copy_context is False
+    """
+    nsm = native_security_manager
+    testcontext = SubjectContext(yosai=yosai, security_manager=nsm)
+
+    with mock.patch.object(nsm, 'ensure_security_manager') as nsm_esm, \
+            mock.patch.object(nsm, 'resolve_session'), \
+            mock.patch.object(nsm, 'resolve_identifiers'), \
+            mock.patch.object(nsm, 'do_create_subject'), \
+            mock.patch.object(nsm, 'save'):
+
+        nsm.create_subject(subject_context=testcontext, copy_context=copy_context)
+
+        assert (nsm_esm.call_args[0][0] is testcontext) == is_same
+
+
 def test_nsm_rememberme_successful_login(
         native_security_manager, mock_remember_me_manager, monkeypatch):
     """
@@ -669,54 +791,63 @@ def test_nsm_resolve_session_returns_none(
     assert result == msc
 
 
-def test_nsm_resolve_session_contextsessionisnone(
+def test_nsm_resolve_session_contextsessionisinvalid(
         native_security_manager, mock_subject_context, monkeypatch):
     """
     unit tested:  resolve_session
 
     test case:
      - the subject_context doesnt resolve a session
-     - resolve_context_session returns None,
+     - the session manager raises InvalidSessionException for the key,
      - subject_context.session doesn't get set
 
     """
     nsm = native_security_manager
     msc = mock_subject_context
     msc.resolve_session.return_value = None
+    monkeypatch.setattr(nsm, 'get_session_key', lambda x: 'sessionkey123')
 
-    with mock.patch.object(NativeSecurityManager,
-                           'resolve_context_session') as nsm_rcs:
-        nsm_rcs.side_effect = InvalidSessionException
+    with mock.patch.object(nsm, 'get_session') as nsm_gs:
+        nsm_gs.side_effect = InvalidSessionException
         result = nsm.resolve_session(msc)
         assert not hasattr(result, 'session')
 
 
-def test_nsm_resolve_context_session_nokey(
-        native_security_manager, monkeypatch):
+def test_nsm_resolve_session_nokey(
+        native_security_manager, mock_subject_context, monkeypatch):
     """
-    unit tested:  resolve_context_session
+    unit tested:  resolve_session
 
     test case:
-    get_session_key returns none , returning None
+    get_session_key returns none, so no session is looked up or set
     """
     nsm = native_security_manager
+    msc = mock_subject_context
+    msc.resolve_session.return_value = None
     monkeypatch.setattr(nsm, 'get_session_key', lambda x: None)
-    result = nsm.resolve_context_session('subject_context')
-    assert result is None
 
-def test_nsm_resolve_context_session(native_security_manager, monkeypatch):
+    with mock.patch.object(nsm, 'get_session') as nsm_gs:
+        result = nsm.resolve_session(msc)
+        nsm_gs.assert_not_called()
+        assert not hasattr(result, 'session')
+
+
+def test_nsm_resolve_session_fromkey(
+        native_security_manager, mock_subject_context, monkeypatch):
     """
-    unit tested:  resolve_context_session
+    unit tested:  resolve_session
 
     test case:
-    get_session_key returns a key, so get_session called and returns
+    get_session_key returns a key, so get_session called and its session set
     """
     nsm = native_security_manager
+    msc = mock_subject_context
+    msc.resolve_session.return_value = None
     monkeypatch.setattr(nsm, 'get_session_key', lambda x: 'sessionkey123')
     monkeypatch.setattr(nsm, 'get_session', lambda x: 'session')
 
-    result = nsm.resolve_context_session('subject_context')
-    assert result == 'session'
+    result = nsm.resolve_session(msc)
+    assert result.session == 'session'
 
 
 def test_nsm_get_session_key_w_sessionid(
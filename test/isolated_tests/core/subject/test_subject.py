@@ -232,6 +232,26 @@ def test_dsc_resolve_host_notexists_session(subject_context, monkeypatch):
     result = dsc.resolve_host(mock.MagicMock(host='sessionhost'))
     assert result == 'sessionhost'
 
+
+def test_dsc_copy(subject_context, monkeypatch):
+    """
+    unit tested:  __copy__
+
+    test case:
+    the copy is a distinct context of the same type, sharing attribute values
+    """
+    dsc = subject_context
+    monkeypatch.setattr(dsc, 'host', 'somehost')
+
+    result = dsc.__copy__()
+
+    assert type(result) is type(dsc)
+    assert result is not dsc
+    assert vars(result) == vars(dsc)
+
+    result.host = 'otherhost'
+    assert dsc.host == 'somehost'
+
 # ------------------------------------------------------------------------------
 # DelegatingSubject
 # ------------------------------------------------------------------------------
@@ -25,7 +25,8 @@ def test_yosai_get_subject_returns_subject(mock_dsc, mock_gsc, yosai, monkeypatc
     mock_sm.create_subject.return_value = 'subject'
     monkeypatch.setattr(yosai, 'security_manager', mock_sm)
     result = yosai._get_subject()
-    mock_sm.create_subject.assert_called_once_with(subject_context='dsc')
+    mock_sm.create_subject.assert_called_once_with(subject_context='dsc',
+                                                    copy_context=False)
     mock_gsc.stack.append.assert_called_once_with('subject')
     assert result == 'subject'
 
@@ -108,7 +108,7 @@ def test_web_yosai_get_subject_returns_subject(
         mock_wsc.assert_called_once_with(yosai=web_yosai,
                                          security_manager=web_yosai.security_manager,
                                          web_registry=mock_web_registry)
-        mock_cs.assert_called_once_with(subject_context='wsc')
+        mock_cs.assert_called_once_with(subject_context='wsc', copy_context=False)
         assert result == mock_ws
 
 
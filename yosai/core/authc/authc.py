@@ -157,10 +157,10 @@ class DefaultAuthenticator(authc_abcs.Authenticator):
 
     def init_token_resolution(self):
         token_resolver = defaultdict(list)
+        # init_realms already narrowed self.realms to AuthenticatingRealms:
         for realm in self.realms:
-            if isinstance(realm, realm_abcs.AuthenticatingRealm):
-                for token_class in realm.supported_authc_tokens:
-                    token_resolver[token_class].append(realm)
+            for token_class in realm.supported_authc_tokens:
+                token_resolver[token_class].append(realm)
         return token_resolver
 
     def locate_locking_realm(self):
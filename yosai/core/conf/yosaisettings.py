@@ -29,6 +29,7 @@ This design is inspired by, or a copy of, source code written for Django.
 """
 import logging
 from pathlib import Path
+import threading
 import yaml
 import os
 
@@ -49,6 +50,7 @@ class LazySettings:
             raise TypeError('Must specifify either an env_var or file_path.')
         self.__dict__["env_var"] = env_var
         self.__dict__["file_path"] = file_path
+        self.__dict__["_setup_lock"] = threading.Lock()
 
     def __getattr__(self, name):
         if self._wrapped is empty:
@@ -80,21 +82,29 @@ class LazySettings:
         Load the settings module referenced by env_var. This environment-
         defined configuration process is called during the settings
         configuration process.
-        """
-        envvar = self.__dict__['env_var']
-        if envvar:
-            settings_file = os.environ.get(envvar)
-        else:
-            settings_file = self.__dict__['file_path']
 
-        if not settings_file:
-            msg = ("Requested settings, but none can be obtained for the envvar."
-                   "Since no config filepath can be obtained, a default config "
-                   "will be used.")
-            logger.error(msg)
-            raise OSError(msg)
-
-        self._wrapped = Settings(settings_file)
+        Callers check for empty settings before calling, without locking;
+        the check is repeated under the lock so that concurrent first
+        accesses load the settings file only once.
+        """
+        with self.__dict__['_setup_lock']:
+            if self._wrapped is not empty:
+                return
+
+            envvar = self.__dict__['env_var']
+            if envvar:
+                settings_file = os.environ.get(envvar)
+            else:
+                settings_file = self.__dict__['file_path']
+
+            if not settings_file:
+                msg = ("Requested settings, but none can be obtained for the envvar."
+                       "Since no config filepath can be obtained, a default config "
+                       "will be used.")
+                logger.error(msg)
+                raise OSError(msg)
+
+            self._wrapped = Settings(settings_file)
 
 
 class Settings:
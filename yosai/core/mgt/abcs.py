@@ -186,7 +186,8 @@ class SecurityManager(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def create_subject(self, authc_token=None, account_id=None, existing_subject=None, subject_context=None):
+    def create_subject(self, authc_token=None, account_id=None, existing_subject=None,
+                       subject_context=None, copy_context=True):
         """
         Creates a Subject instance that reflects the specified contextual data.
 
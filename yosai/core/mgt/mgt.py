@@ -340,6 +340,28 @@ class AbstractRememberMeManager(mgt_abcs.RememberMeManager):
 
 # also known as ApplicationSecurityManager in Shiro 2.0 alpha:
 class NativeSecurityManager(mgt_abcs.SecurityManager):
+    """
+    Setting the authorizer or session_manager binds that component's own
+    methods onto the instance, where they shadow this class's pass-through
+    methods of the same name (is_permitted, check_role, start, get_session,
+    et al.), sparing a call per request.  A method that a subclass overrides
+    is not bound, so the override is always the one that runs.
+
+    The bound methods are those of the component as it was when assigned:
+    patching or replacing a method on the authorizer or session_manager
+    afterwards does not reach the security manager.  Re-assign the component
+    instead, or patch the authorizer / session_manager attribute itself, whose
+    deleter unbinds the methods so that a restore re-binds them.
+    """
+
+    authorizer_methods = ('is_permitted',
+                          'is_permitted_collective',
+                          'check_permission',
+                          'has_role',
+                          'has_role_collective',
+                          'check_role')
+
+    session_manager_methods = ('start', 'get_session')
 
     def __init__(self,
                  yosai,
@@ -355,7 +377,7 @@ class NativeSecurityManager(mgt_abcs.SecurityManager):
 
         self.yosai = yosai
         self.subject_store = subject_store
-        self.realms = realms
+        self.realms = tuple(realms) if realms else ()
         self.remember_me_manager = remember_me_manager
 
         if not session_manager:
@@ -397,6 +419,56 @@ class NativeSecurityManager(mgt_abcs.SecurityManager):
         self.authenticator.init_realms(self.realms)
         self.authorizer.init_realms(self.realms)
 
+    @property
+    def authorizer(self):
+        return self._authorizer
+
+    @authorizer.setter
+    def authorizer(self, authorizer):
+        self._authorizer = authorizer
+        self.bind_delegate_methods(authorizer, self.authorizer_methods)
+
+    @authorizer.deleter
+    def authorizer(self):
+        del self._authorizer
+        self.unbind_delegate_methods(self.authorizer_methods)
+
+    @property
+    def session_manager(self):
+        return self._session_manager
+
+    @session_manager.setter
+    def session_manager(self, session_manager):
+        self._session_manager = session_manager
+        self.bind_delegate_methods(session_manager, self.session_manager_methods)
+
+    @session_manager.deleter
+    def session_manager(self):
+        del self._session_manager
+        self.unbind_delegate_methods(self.session_manager_methods)
+
+    def bind_delegate_methods(self, delegate, method_names):
+        """
+        Binds the delegate's methods onto this instance in place of the
+        pass-through methods of the same name, unless a subclass overrides them
+
+        :type method_names: tuple of Strings
+        """
+        cls = type(self)
+        for name in method_names:
+            if getattr(cls, name) is getattr(NativeSecurityManager, name):
+                setattr(self, name, getattr(delegate, name))
+
+    def unbind_delegate_methods(self, method_names):
+        """
+        Removes the delegate's methods bound onto this instance, uncovering the
+        pass-through methods of the same name
+
+        :type method_names: tuple of Strings
+        """
+        for name in method_names:
+            self.__dict__.pop(name, None)
+
     def is_permitted(self, identifiers, permission_s):
         """
         :type identifiers: SimpleIdentifierCollection
@@ -515,7 +587,8 @@ class NativeSecurityManager(mgt_abcs.SecurityManager):
                        authc_token=None,
                        account_id=None,
                        existing_subject=None,
-                       subject_context=None):
+                       subject_context=None,
+                       copy_context=True):
         """
         Creates a ``Subject`` instance for the user represented by the given method
         arguments.
@@ -551,6 +624,12 @@ class NativeSecurityManager(mgt_abcs.SecurityManager):
 
         :type subject_context:  subject_abcs.SubjectContext
 
+        :param copy_context: whether to resolve a copy of subject_context, so
+                             that the caller's context is left untouched;
+                             callers that do not reuse their context may pass
+                             False to spare the copy
+        :type copy_context: bool
+
         :returns:  the Subject instance that represents the context and session
                    data for the newly authenticated subject
         """
@@ -565,8 +644,11 @@ class NativeSecurityManager(mgt_abcs.SecurityManager):
             if (existing_subject):
                 context.subject = existing_subject
 
+        elif copy_context:
+            context = copy.copy(subject_context)
+
         else:
-            context = copy.copy(subject_context)  # if this necessary? TBD.
+            context = subject_context
 
         context = self.ensure_security_manager(context)
         context = self.resolve_session(context)
@@ -786,11 +868,12 @@ class NativeSecurityManager(mgt_abcs.SecurityManager):
         try:
             # Context couldn't resolve it directly, let's see if we can
             # since we  have direct access to the session manager:
-            session = self.resolve_context_session(subject_context)
+            session_key = self.get_session_key(subject_context)
 
-            # if session is None, given that subject_context.session
-            # is None there is no harm done by setting it to None again
-            subject_context.session = session
+            # without a key there is no session to resolve, and
+            # subject_context.session is already None:
+            if (session_key is not None):
+                subject_context.session = self.get_session(session_key)
 
         except InvalidSessionException:
             msg = ("Resolved subject_subject_context context session is "
@@ -800,14 +883,6 @@ class NativeSecurityManager(mgt_abcs.SecurityManager):
 
         return subject_context
 
-    def resolve_context_session(self, subject_context):
-        session_key = self.get_session_key(subject_context)
-
-        if (session_key is not None):
-            return self.get_session(session_key)
-
-        return None
-
     def get_session_key(self, subject_context):
         session_id = subject_context.session_id
         if (session_id is not None):
@@ -881,11 +956,10 @@ class NativeSecurityManager(mgt_abcs.SecurityManager):
 
         self.before_logout(subject)
 
-        identifiers = copy.copy(subject.identifiers)   # copy is new to yosai
+        identifiers = subject.identifiers
         if (identifiers):
-            msg = ("Logging out subject with primary identifier {0}".format(
-                   identifiers.primary_identifier))
-            logger.debug(msg)
+            logger.debug("Logging out subject with primary identifier %s",
+                         identifiers.primary_identifier)
 
         try:
             # this removes two internal attributes from the session:
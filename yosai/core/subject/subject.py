@@ -58,6 +58,12 @@ class SubjectContext(subject_abcs.SubjectContext):
         self.session_creation_enabled = True
         self.subject = None
 
+    def __copy__(self):
+        # a shallow copy of the attributes, bypassing __reduce_ex__:
+        context = type(self).__new__(type(self))
+        context.__dict__.update(self.__dict__)
+        return context
+
     def resolve_security_manager(self):
         security_manager = self.security_manager
         if (security_manager is None):
@@ -436,11 +442,10 @@ class DelegatingSubject(subject_abcs.Subject):
         """
         :type create:  bool
         """
-        msg = ("{0} attempting to get session; create = {1}; \'session is None\' ="
-               "{2} ; \'session has id\' = {3}".
-               format(self.__class__.__name__, create, (self.session is None), str(
-                      self.session is not None and bool(self.session.session_id))))
-        logger.debug(msg)
+        logger.debug("%s attempting to get session; create = %s; 'session is None' ="
+                     "%s ; 'session has id' = %s", self.__class__.__name__, create,
+                     (self.session is None),
+                     self.session is not None and bool(self.session.session_id))
 
         if self.session and not create:  # touching a new session is redundant
             self.session.touch()  # this is used to reset the idle timer (new to yosai)
@@ -456,8 +461,7 @@ class DelegatingSubject(subject_abcs.Subject):
                        "Sessions to be created for the current Subject.")
                 raise ValueError(msg)
 
-            msg = ("Starting session for host ", str(self.host))
-            logger.debug(msg)
+            logger.debug("Starting session for host %s", self.host)
 
             session_context = self.create_session_context()
             session = self.security_manager.start(session_context)
@@ -711,10 +715,9 @@ class SubjectStore:
                 to_set.append([self.dsc_isk, current_identifiers])
                 to_set.append([self.dsc_ask, True])
 
-                msg = ('merge_identity _DID NOT_ find a session for current subject '
-                       'and so created a new one (session_id: {0}). Now merging '
-                       'internal attributes: {1}'.format(session.session_id, to_set))
-                logger.debug(msg)
+                logger.debug('merge_identity _DID NOT_ find a session for current '
+                             'subject and so created a new one (session_id: %s). Now '
+                             'merging internal attributes: %s', session.session_id, to_set)
                 session.set_internal_attributes(to_set)
         else:
             self.merge_identity_with_session(current_identifiers, subject, session)
@@ -793,7 +796,8 @@ class Yosai:
         """
         subject_context = SubjectContext(yosai=self,
                                                 security_manager=self.security_manager)
-        subject = self.security_manager.create_subject(subject_context=subject_context)
+        subject = self.security_manager.create_subject(subject_context=subject_context,
+                                                       copy_context=False)
         global_subject_context.stack.append(subject)
         return subject
 
@@ -881,7 +885,7 @@ class Yosai:
                        "current Subject is NOT a user (they haven't been "
                        "authenticated or remembered from a previous login). "
                        "ACCESS DENIED.")
-                print('\n\n', msg)
+                logger.debug(msg)
                 raise UnauthenticatedException(msg)
 
             return fn(*args, **kwargs)
@@ -1,5 +1,7 @@
 class WebRegistrySettings:
 
+    __slots__ = ('signed_cookie_secret', 'cookie_attributes')
+
     def __init__(self, settings):
         wr_config = settings.WEB_REGISTRY
         self.signed_cookie_secret = wr_config.get('signed_cookie_secret')
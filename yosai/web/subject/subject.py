@@ -162,7 +162,8 @@ class WebYosai(Yosai):
         subject_context = WebSubjectContext(yosai=self,
                                             security_manager=self.security_manager,
                                             web_registry=web_registry)
-        subject = self.security_manager.create_subject(subject_context=subject_context)
+        subject = self.security_manager.create_subject(subject_context=subject_context,
+                                                       copy_context=False)
 
         if not hasattr(subject, 'web_registry'):
             msg = ("Subject implementation returned from the SecurityManager"